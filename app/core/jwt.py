@@ -7,15 +7,31 @@ Functions
 ---------
 - create_access_token(subject, expires_delta): Create a signed JWT.
 - decode_token(token): Decode and validate a JWT, returning the payload.
+
+Decoded payloads are memoized per raw token string in a bounded LRU so repeat
+requests with the same bearer token skip signature verification and JSON
+parsing. Entries expire at the token's own ``exp`` claim.
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional, Union
 
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.utils.cache import LRUCache
+
+# Resolved once at import; settings are not reloaded at runtime
+_SECRET = settings.SECRET_KEY
+_ALG = settings.ALGORITHM
+_ALGORITHMS = [_ALG]
+_EXP_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Decoded payloads keyed by the full token string; a tampered signature yields a
+# different key and therefore a cache miss.
+_decode_cache: LRUCache[Dict[str, Any]] = LRUCache(maxsize=4096)
 
 
 def create_access_token(
@@ -37,14 +53,14 @@ def create_access_token(
     str
         Encoded JWT string.
     """
-    now = datetime.now(tz=timezone.utc)
-    expire = now + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta is not None else _EXP_SECONDS
 
-    to_encode: Dict[str, Any] = {"sub": str(subject), "iat": int(now.timestamp()), "exp": int(expire.timestamp())}
+    to_encode: Dict[str, Any] = {"sub": str(subject), "iat": now, "exp": now + ttl}
     if extra_claims:
         to_encode.update(extra_claims)
 
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=_ALG)
     return encoded_jwt
 
 
@@ -65,6 +81,18 @@ def decode_token(token: str) -> Dict[str, Any]:
     ------
     jose.JWTError
         If the token is invalid or expired.
+
+    Notes
+    -----
+    Successful decodes are cached until the token's ``exp``. The returned dict
+    is shared between callers and must not be mutated.
     """
-    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    payload = _decode_cache.get(token)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, _SECRET, algorithms=_ALGORITHMS)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _decode_cache.set(token, payload, expires_at=float(exp))
     return payload
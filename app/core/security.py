@@ -1,24 +1,71 @@
 """Password hashing and verification utilities.
 
-Provides a thin wrapper around Passlib's bcrypt password hashing for secure
-storage of user passwords.
+Provides a thin wrapper around Passlib for secure storage of user passwords.
+New hashes use argon2id; bcrypt remains enabled so existing bcrypt hashes
+still verify at the cost stored in each hash. The argon2id cost is
+configurable via ``ARGON2_TIME_COST`` and ``ARGON2_MEMORY_COST``.
 
 Functions
 ---------
-- get_password_hash(password): Return a bcrypt hash of the given password.
+- get_password_hash(password): Return an argon2id hash of the given password.
 - verify_password(plain_password, hashed_password): Verify a password against a
   previously stored hash.
+- get_password_hash_async / verify_password_async: Awaitable variants that run
+  the hash in a worker thread gated by a dedicated ``CapacityLimiter`` sized to
+  the CPU count, so bursts of signups/logins cannot exhaust the shared
+  threadpool used by other sync endpoints. Callers must keep their own
+  blocking DB work off the event loop.
+
+Verification results are memoized in a bounded LRU keyed by an HMAC of the
+plaintext (under a per-process random key) plus the stored hash, so repeat
+logins with the same credentials skip the expensive hash computation. The plaintext
+itself is never kept in memory.
 """
 from __future__ import annotations
 
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from typing import Tuple
+
+import anyio
 from passlib.context import CryptContext
 
-# Bcrypt context for hashing and verification
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.utils.cache import LRUCache
+
+# Argon2id for new hashes; bcrypt kept to verify legacy hashes
+_pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=1,
+)
+
+# Process-local key so cache keys cannot be precomputed from known passwords
+_cache_key = secrets.token_bytes(32)
+_verify_cache: LRUCache[bool] = LRUCache(maxsize=2048)
+# Failed verifications are only remembered briefly
+_NEGATIVE_TTL_SECONDS = 5.0
+
+# Hashing is CPU-bound: more concurrent workers than cores only adds queueing.
+# Created lazily because a CapacityLimiter must be built inside an event loop.
+_hash_limiter: anyio.CapacityLimiter | None = None
+
+
+def _get_hash_limiter() -> anyio.CapacityLimiter:
+    global _hash_limiter
+    if _hash_limiter is None:
+        _hash_limiter = anyio.CapacityLimiter(os.cpu_count() or 4)
+    return _hash_limiter
 
 
 def get_password_hash(password: str) -> str:
-    """Return a bcrypt hash of ``password``.
+    """Return an argon2id hash of ``password``.
 
     Parameters
     ----------
@@ -28,7 +75,7 @@ def get_password_hash(password: str) -> str:
     Returns
     -------
     str
-        Bcrypt hash suitable for storage.
+        Password hash suitable for storage.
     """
     return _pwd_context.hash(password)
 
@@ -41,11 +88,42 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     plain_password : str
         User-provided plain text password.
     hashed_password : str
-        Stored bcrypt hash to verify against.
+        Stored argon2 or bcrypt hash to verify against.
 
     Returns
     -------
     bool
         True if the password is valid, False otherwise.
     """
-    return _pwd_context.verify(plain_password, hashed_password)
+    key = _verify_cache_key(plain_password, hashed_password)
+    cached = _verify_cache.get(key)
+    if cached is not None:
+        return cached
+    return _verify_and_store(key, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash ``password`` in a worker thread bounded by the hashing limiter."""
+    return await anyio.to_thread.run_sync(get_password_hash, password, limiter=_get_hash_limiter())
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Awaitable ``verify_password``; cache hits return without leaving the loop."""
+    key = _verify_cache_key(plain_password, hashed_password)
+    cached = _verify_cache.get(key)
+    if cached is not None:
+        return cached
+    return await anyio.to_thread.run_sync(
+        _verify_and_store, key, plain_password, hashed_password, limiter=_get_hash_limiter()
+    )
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> Tuple[bytes, str]:
+    digest = hmac.new(_cache_key, plain_password.encode(), hashlib.sha256).digest()
+    return (digest, hashed_password)
+
+
+def _verify_and_store(key: Tuple[bytes, str], plain_password: str, hashed_password: str) -> bool:
+    ok = _pwd_context.verify(plain_password, hashed_password)
+    _verify_cache.set(key, ok, expires_at=None if ok else time.time() + _NEGATIVE_TTL_SECONDS)
+    return ok
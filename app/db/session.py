@@ -4,11 +4,29 @@ Creates the SQLAlchemy engine, session factory, and declarative base. Uses the
 configuration from ``app.core.config.settings``. For SQLite, sets
 ``check_same_thread=False`` to allow using the same connection across threads in
 FastAPI.
+
+``SessionLocal`` is a ``scoped_session`` keyed by the current request scope (a
+context variable set by ``DBSessionMiddleware``), so every dependency within one
+request shares a single session, which the middleware removes afterwards.
+Using it outside a request raises; code outside requests (scripts, startup
+tasks) should open its own session from ``SessionFactory`` and close it.
+
+SQLite connections are configured on connect for WAL journaling and relaxed
+fsync (``synchronous=NORMAL``), a larger page cache, in-memory temp storage,
+and enforced foreign keys.
+
+In-memory SQLite lives in a single connection, so it is pooled as exactly one
+exclusively checked-out connection: sessions never share a transaction, and
+concurrent requests wait their turn. Use a file database for real concurrency.
 """
 from __future__ import annotations
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+import contextvars
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
 
@@ -19,8 +37,77 @@ class Base(DeclarativeBase):
 
 # SQLite needs check_same_thread=False when used with FastAPI/Uvicorn
 connect_args = {}
+engine_kwargs: dict[str, Any] = {}
 if settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
+    if ":memory:" in settings.DATABASE_URL or settings.DATABASE_URL in ("sqlite://", "sqlite+pysqlite://"):
+        # The database exists only inside one connection. Lend it to one session
+        # at a time (StaticPool would share it, and its transaction, across
+        # concurrent sessions, so one request's rollback could undo another's).
+        engine_kwargs = {"poolclass": QueuePool, "pool_size": 1, "max_overflow": 0}
+    else:
+        # Long-lived pooled connections keep their PRAGMAs and skip re-opening the file
+        engine_kwargs = {
+            "poolclass": QueuePool,
+            "pool_size": 10,
+            "max_overflow": 20,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+        }
+
+engine = create_engine(settings.DATABASE_URL, connect_args=connect_args, **engine_kwargs)
+
+if settings.DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn: Any, _: Any) -> None:
+        """Apply performance PRAGMAs to every new SQLite connection."""
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA cache_size=-64000")
+        cur.execute("PRAGMA foreign_keys=ON")
+        cur.close()
+
+# Identifies the request currently being served; None outside of requests
+_request_scope: contextvars.ContextVar[Optional[object]] = contextvars.ContextVar("db_request_scope", default=None)
+
+
+def _current_request_scope() -> object:
+    """Return the active request scope, refusing to fall back to a shared one."""
+    scope = _request_scope.get()
+    if scope is None:
+        raise RuntimeError(
+            "SessionLocal used outside a request handled by DBSessionMiddleware; "
+            "use SessionFactory() and close the session yourself"
+        )
+    return scope
+
+
+SessionFactory = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+SessionLocal = scoped_session(SessionFactory, scopefunc=_current_request_scope)
+
+
+class DBSessionMiddleware:
+    """ASGI middleware giving each HTTP request or WebSocket its own scoped session.
+
+    Sets a fresh request scope before calling the app and always calls
+    ``SessionLocal.remove()`` afterwards, closing the session and returning its
+    connection to the pool.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+        token = _request_scope.set(object())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            SessionLocal.remove()
+            _request_scope.reset(token)
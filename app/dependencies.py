@@ -1,66 +1,87 @@
 """FastAPI dependency providers.
 
 Includes database session management and the current user resolver based on
-Bearer JWTs in the Authorization header.
+Bearer JWTs in the Authorization header. Resolved users are cached briefly by
+ID so hot callers skip the per-request user lookup.
 """
 from __future__ import annotations
 
 from typing import Generator
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.jwt import decode_token
 from app.db.session import SessionLocal
 from app.models import User
+from app.utils.cache import LRUCache
 
 
-security_scheme = HTTPBearer(auto_error=False)
+# OpenAPI security scheme name; main.py registers it and attaches it to every
+# route depending on get_current_user so Swagger keeps its Authorize button.
+BEARER_SCHEME_NAME = "HTTPBearer"
+
+# Recently resolved users keyed by ID. Entries are detached snapshots that never
+# belong to a session, so rollbacks/expiry in one request cannot affect them.
+_user_cache: LRUCache[User] = LRUCache(maxsize=2048, ttl=30)
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+# Preallocated 401s for the auth failure paths. Each raise clears the previous
+# traceback so re-raising the shared instance does not keep growing it.
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+_UNAUTH_NOT_AUTHED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated", headers=_BEARER_CHALLENGE
+)
+_UNAUTH_INVALID = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token", headers=_BEARER_CHALLENGE
+)
+_UNAUTH_NO_USER = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found", headers=_BEARER_CHALLENGE
+)
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Yield a database session and ensure it is closed after request."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    """Yield the request-scoped database session.
+
+    The session is closed by ``DBSessionMiddleware`` once the request finishes.
+    """
+    yield SessionLocal()
 
 
-def get_current_user(
-    creds: HTTPAuthorizationCredentials | None = Depends(security_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     """Resolve the authenticated ``User`` from the Bearer token.
 
-    Expects an ``Authorization: Bearer <token>`` header. On failure, raises
-    401 Unauthorized with a WWW-Authenticate header per RFC6750.
+    Expects an ``Authorization: Bearer <token>`` header, read directly from the
+    request rather than through ``HTTPBearer``. On failure, raises 401
+    Unauthorized with a WWW-Authenticate header per RFC6750.
     """
-    if creds is None or not creds.scheme.lower() == "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    auth = request.headers.get("authorization")
+    if not auth or auth[:7].lower() != "bearer " or len(auth) == 7:
+        raise _UNAUTH_NOT_AUTHED.with_traceback(None)
 
     try:
-        payload = decode_token(creds.credentials)
+        payload = decode_token(auth[7:])
         subject = payload.get("sub")
         user_id = int(subject)
     except Exception:  # jose.JWTError or ValueError
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from None
+        raise _UNAUTH_INVALID.with_traceback(None) from None
+
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        # Attach a copy to this request's session without re-querying
+        return db.merge(cached, load=False)
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _UNAUTH_NO_USER.with_traceback(None)
 
+    _user_cache.set(user_id, _detached_snapshot(user))
     return user
+
+
+def _detached_snapshot(user: User) -> User:
+    """Copy ``user``'s column values into a new, detached ``User`` instance."""
+    snapshot = User(**{key: getattr(user, key) for key in _USER_COLUMNS})
+    make_transient_to_detached(snapshot)
+    return snapshot
@@ -1,23 +1,30 @@
 """Main application entrypoint for the Fitness Studio Booking API.
 
-Exposes a minimal FastAPI app with a healthcheck endpoint. Routers for
-authentication, classes, and bookings will be registered here as they are
-implemented.
+Exposes the FastAPI app with a healthcheck endpoint and registers the
+authentication, classes, and bookings routers.
 
 All documentation follows the project's Code Documentation Rulebook.
 """
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import text
 
 # Reduce noisy passlib bcrypt version warning before routers import passlib
 logging.getLogger("passlib.handlers.bcrypt").setLevel(logging.ERROR)
 
 from app.routers import auth, classes, bookings
-from app.db.session import Base, engine
+from app.db.session import Base, DBSessionMiddleware, engine
+from app.dependencies import BEARER_SCHEME_NAME, get_current_user
 
 app = FastAPI(
     title="Fitness Studio Booking API",
@@ -26,7 +33,16 @@ app = FastAPI(
         "API for user signup/login, managing fitness classes, and booking slots. "
         "Backed by SQLite and implemented with FastAPI."
     ),
+    # orjson renders responses (including datetimes) in C instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
+app.add_middleware(DBSessionMiddleware)
+
+
+@lru_cache(maxsize=1)
+def _utc_iso(epoch_second: int) -> str:
+    """Return the ISO-8601 UTC string for ``epoch_second`` (memoized per second)."""
+    return datetime.fromtimestamp(epoch_second, tz=timezone.utc).isoformat()
 
 
 @app.get("/health", tags=["health"])  # response intentionally simple
@@ -40,7 +56,8 @@ def health() -> dict:
     dict
         An object with keys: ``status`` and ``time``.
     """
-    return {"status": "ok", "time": datetime.now(tz=timezone.utc).isoformat()}
+    # One-second resolution; the string is reused for all probes in that second
+    return {"status": "ok", "time": _utc_iso(int(time.time()))}
 
 
 # Routers
@@ -49,14 +66,58 @@ app.include_router(classes.router)
 app.include_router(bookings.router)
 
 
+def _requires_auth(dependant: Dependant) -> bool:
+    """Return True if ``get_current_user`` appears anywhere in the dependency tree."""
+    return any(d.call is get_current_user or _requires_auth(d) for d in dependant.dependencies)
+
+
+def custom_openapi() -> dict[str, Any]:
+    """Build the OpenAPI schema with the Bearer scheme on authenticated routes.
+
+    ``get_current_user`` parses the Authorization header itself, so FastAPI no
+    longer infers a security requirement; it is declared here instead.
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+
+    # Delegate to FastAPI's own builder so every app-level OpenAPI setting is kept
+    schema = FastAPI.openapi(app)
+    schema.setdefault("components", {}).setdefault("securitySchemes", {})[BEARER_SCHEME_NAME] = {
+        "type": "http",
+        "scheme": "bearer",
+    }
+    for route in app.routes:
+        if isinstance(route, APIRoute) and _requires_auth(route.dependant):
+            for method in route.methods:
+                # Routes with include_in_schema=False have no entry to annotate
+                operation = schema["paths"].get(route.path_format, {}).get(method.lower())
+                if operation is not None:
+                    operation["security"] = [{BEARER_SCHEME_NAME: []}]
+
+    app.openapi_schema = schema
+    return schema
+
+
+app.openapi = custom_openapi
+
+
 @app.on_event("startup")
 def on_startup() -> None:
     """Initialize application state on startup.
 
     - Ensures all database tables are created based on SQLAlchemy models.
+    - Creates indexes added after a table already existed, since
+      ``create_all`` skips existing tables entirely, and drops superseded ones.
     """
     # Import models to ensure SQLAlchemy registers all tables before create_all
     import app.models  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    # Superseded by ix_bookings_user_created, whose leading column is user_id
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_bookings_user_id"))
 
@@ -11,6 +11,8 @@ Notes
   before persisting. SQLite does not enforce timezone, but SQLAlchemy will
   keep offsets through Python objects.
 - We prevent duplicate bookings via a unique constraint on (user_id, class_id).
+- A composite index on (user_id, created_at DESC) serves the "my bookings"
+  listing as an index range scan without a separate sort.
 """
 from __future__ import annotations
 
@@ -19,10 +21,12 @@ from datetime import datetime
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,7 +45,7 @@ class User(Base):
     email : str
         Unique email used for login/identification.
     hashed_password : str
-        Bcrypt-hashed password.
+        Argon2id (or legacy bcrypt) password hash.
     created_at : datetime
         Server-side creation timestamp (UTC).
     """
@@ -113,11 +117,13 @@ class Booking(Base):
     __tablename__ = "bookings"
     __table_args__ = (
         UniqueConstraint("user_id", "class_id", name="uq_booking_user_class"),
+        Index("ix_bookings_user_created", "user_id", text("created_at DESC")),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Indexed by the leading column of ix_bookings_user_created
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     class_id: Mapped[int] = mapped_column(ForeignKey("classes.id", ondelete="CASCADE"), nullable=False, index=True)
 
     client_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -1,14 +1,17 @@
-"""Authentication routes: signup and (later) login.
+"""Authentication routes: signup and login.
 
-This module currently implements the user signup endpoint. The login endpoint
-will be added in the next task to keep commits aligned with the TODO plan.
+Implements user signup (``POST /signup``) and JWT login (``POST /login``).
 """
 from __future__ import annotations
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.core.jwt import create_access_token
 from app.dependencies import get_db
 from app.models import User
@@ -18,37 +21,47 @@ router = APIRouter(tags=["auth"])
 
 
 @router.post("/signup", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def signup(user_in: UserCreate, db: Session = Depends(get_db)) -> UserOut:
+async def signup(user_in: UserCreate, db: Session = Depends(get_db)) -> UserOut:
     """Register a new user.
 
     Validates that the email is not already registered, hashes the password,
     and stores the user record.
     """
-    existing = db.query(User).filter(User.email == user_in.email).first()
-    if existing:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
-
-    user = User(
-        name=user_in.name,
-        email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+    # Async only so the hash can be awaited under the dedicated hashing limiter;
+    # blocking DB work still runs in the threadpool, never on the event loop.
+    hashed_password = await get_password_hash_async(user_in.password)
+    return await run_in_threadpool(_create_user, db, user_in, hashed_password)
 
 
 @router.post("/login", response_model=Token)
-def login(credentials: Login, db: Session = Depends(get_db)) -> Token:
+async def login(credentials: Login, db: Session = Depends(get_db)) -> Token:
     """Authenticate a user and issue a JWT access token.
 
     Returns 401 if the credentials are invalid. On success, returns a bearer
     token suitable for use in the Authorization header.
     """
-    user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    user = await run_in_threadpool(_get_user_by_email, db, credentials.email)
+    if not user or not await verify_password_async(credentials.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     token = create_access_token(subject=user.id)
     return Token(access_token=token, token_type="bearer")
+
+
+def _create_user(db: Session, user_in: UserCreate, hashed_password: str) -> User:
+    """Insert the user row, translating a duplicate email into 409 Conflict."""
+    user = User(name=user_in.name, email=user_in.email, hashed_password=hashed_password)
+    db.add(user)
+    # No SELECT first: the unique index on email rejects duplicates atomically
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered") from None
+    db.refresh(user)
+    return user
+
+
+def _get_user_by_email(db: Session, email: str) -> Optional[User]:
+    """Return the user registered with ``email``, if any."""
+    return db.query(User).filter(User.email == email).first()
@@ -1,20 +1,27 @@
 """Booking routes.
 
-Defines endpoints for booking classes and listing user bookings.
-Initial commit provides the router scaffold; endpoints will be added next.
+Defines endpoints for booking classes (``POST /book``) and listing the
+authenticated user's bookings (``GET /bookings``).
 """
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
 from app.dependencies import get_current_user, get_db
 from app.models import Booking, FitnessClass, User
 from app.schemas import BookingCreate, BookingOut
-from app.utils.time import now_ist, normalize_to_ist
+from app.utils.time import is_past_in_ist, now_ist
 
 router = APIRouter(tags=["bookings"]) 
 
+# Built once so each request reuses the compiled pydantic-core validator/serializer
+_BOOKINGS_ADAPTER = TypeAdapter(list[BookingOut])
+
 
 @router.post("/book", response_model=BookingOut, status_code=status.HTTP_201_CREATED)
 def book_class(
@@ -30,35 +37,46 @@ def book_class(
     - The same user cannot book the same class twice.
     Side effects: decrements the class's available_slots on success.
     """
-    klass = db.query(FitnessClass).filter(FitnessClass.id == booking_in.class_id).first()
-    if not klass:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found")
+    # The slot decrement is a single conditional UPDATE so concurrent requests
+    # cannot oversell the last seat; only when it matches no row is the class
+    # re-read to report the precise failure. Duplicate bookings are rejected by
+    # the (user_id, class_id) unique constraint.
+    result = db.execute(
+        update(FitnessClass)
+        .where(
+            FitnessClass.id == booking_in.class_id,
+            FitnessClass.available_slots > 0,
+            FitnessClass.date_time >= now_ist(),
+        )
+        .values(available_slots=FitnessClass.available_slots - 1)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        # Plain column select: no ORM instance is built just to read one field
+        row = db.execute(
+            select(FitnessClass.date_time).where(FitnessClass.id == booking_in.class_id)
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found")
 
-    # Normalize to IST to guarantee offset-aware comparison against now_ist()
-    if normalize_to_ist(klass.date_time) < now_ist():
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot book a past class")
+        if is_past_in_ist(row.date_time):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot book a past class")
 
-    if klass.available_slots <= 0:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="No available slots")
 
-    existing = (
-        db.query(Booking)
-        .filter(Booking.user_id == user.id, Booking.class_id == booking_in.class_id)
-        .first()
-    )
-    if existing:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Already booked for this class")
-
     booking = Booking(
         user_id=user.id,
         class_id=booking_in.class_id,
         client_name=booking_in.client_name,
         client_email=booking_in.client_email,
     )
-
-    klass.available_slots -= 1
     db.add(booking)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Also reverts the slot decrement made in this transaction
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Already booked for this class") from None
     db.refresh(booking)
     return booking
 
@@ -67,12 +85,18 @@ def book_class(
 def list_my_bookings(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> list[BookingOut]:
+) -> Response:
     """Return all bookings for the authenticated user (most recent first)."""
+    # The nested class is eager-loaded in one extra query instead of one per booking
     items = (
         db.query(Booking)
+        .options(selectinload(Booking.fitness_class))
         .filter(Booking.user_id == user.id)
         .order_by(Booking.created_at.desc())
         .all()
     )
-    return items
+    # Validate and serialize to JSON bytes in one pass with the prebuilt adapter;
+    # returning a Response makes FastAPI skip its generic response_model path,
+    # which is kept only for the OpenAPI schema.
+    payload = _BOOKINGS_ADAPTER.validate_python(items, from_attributes=True)
+    return Response(_BOOKINGS_ADAPTER.dump_json(payload, by_alias=True), media_type="application/json")
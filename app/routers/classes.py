@@ -1,11 +1,13 @@
 """Class management routes.
 
-Implements creation of fitness classes (auth required). Listing will be added in
-subsequent tasks to keep commits aligned to the TODO plan.
+Implements creation of fitness classes (``POST /classes``, auth required) and
+listing of upcoming classes (``GET /classes``).
 """
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.dependencies import get_current_user, get_db
@@ -15,6 +17,9 @@ from app.utils.time import normalize_to_ist, is_past_in_ist, now_ist
 
 router = APIRouter(prefix="/classes", tags=["classes"])
 
+# Built once so each request reuses the compiled pydantic-core validator/serializer
+_CLASSES_ADAPTER = TypeAdapter(list[ClassOut])
+
 
 @router.post("", response_model=ClassOut, status_code=status.HTTP_201_CREATED)
 def create_class(
@@ -43,7 +48,7 @@ def create_class(
 
 
 @router.get("", response_model=list[ClassOut])
-def list_upcoming_classes(db: Session = Depends(get_db)) -> list[ClassOut]:
+def list_upcoming_classes(db: Session = Depends(get_db)) -> Response:
     """Return all upcoming classes (IST-aware) ordered by date_time ascending."""
     now = now_ist()
     items = (
@@ -52,6 +57,8 @@ def list_upcoming_classes(db: Session = Depends(get_db)) -> list[ClassOut]:
         .order_by(FitnessClass.date_time.asc())
         .all()
     )
-    return items
+    # Serialized by the prebuilt adapter; response_model only documents the shape
+    payload = _CLASSES_ADAPTER.validate_python(items, from_attributes=True)
+    return Response(_CLASSES_ADAPTER.dump_json(payload, by_alias=True), media_type="application/json")
 
 
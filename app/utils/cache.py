@@ -0,0 +1,68 @@
+"""Small in-process caching utilities.
+
+Provides a bounded, thread-safe LRU mapping with optional per-entry expiry.
+Used to memoize expensive, deterministic work on hot request paths (JWT
+decoding, password verification) without pulling in a third-party cache.
+
+Design decisions
+----------------
+- Entries are evicted least-recently-used first once ``maxsize`` is reached.
+- Each entry may carry an absolute expiry (epoch seconds); expired entries are
+  dropped lazily on lookup.
+- A lock guards all mutations because sync FastAPI dependencies run in a
+  threadpool and may hit the cache concurrently.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Bounded LRU cache with optional per-entry expiry.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries kept before evicting the least recently used.
+    ttl : float, optional
+        Default lifetime in seconds for entries stored without an explicit
+        ``expires_at``. ``None`` means entries never expire by default.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V, *, expires_at: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``.
+
+        ``expires_at`` is an absolute epoch timestamp; when omitted, the cache's
+        default ``ttl`` (if any) is applied.
+        """
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
@@ -8,10 +8,13 @@ Design decisions
 - If an input datetime is naive (no tzinfo), we assume it is already in IST.
   This prevents unintentional shifting and aligns with local expectations.
 - If an input datetime is timezone-aware, we convert it to IST.
+- Past/future checks compare epoch timestamps rather than building a new
+  tz-aware "now" datetime per call.
 """
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
 IST = ZoneInfo("Asia/Kolkata")
@@ -34,10 +37,11 @@ def normalize_to_ist(dt: datetime) -> datetime:
 
 
 def is_past_in_ist(dt: datetime) -> bool:
-    """Return True if the given IST datetime is in the past relative to IST now.
+    """Return True if ``dt`` is in the past.
 
-    The input should be timezone-aware in IST. Call ``normalize_to_ist`` first
-    if you are uncertain.
+    Aware datetimes are compared by their absolute instant; naive datetimes are
+    assumed to be IST, consistent with ``normalize_to_ist``.
     """
-    current = now_ist()
-    return dt < current
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=IST)
+    return dt.timestamp() < time.time()